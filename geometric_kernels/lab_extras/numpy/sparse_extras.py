@@ -22,6 +22,12 @@ SparseArray = Union(
 
 _SparseArraySign = Signature(SparseArray)
 
+"""
+Shift used for the shift-invert mode of ARPACK. The graph Laplacian is singular,
+so the shift has to be (slightly) away from its smallest eigenvalue, zero.
+"""
+SHIFT_INVERT_SIGMA = 1e-8
+
 
 @dispatch
 def degree(a: SparseArray):  # type: ignore
@@ -42,7 +48,7 @@ def eigenpairs(L: Union[SparseArray, _Numeric], k: int):
     """
     if sp.issparse(L) and (k == L.shape[0]):
         L = L.toarray()
-    return sp.linalg.eigsh(L, k, sigma=1e-8)
+    return sp.linalg.eigsh(L, k, sigma=SHIFT_INVERT_SIGMA)
 
 
 @dispatch
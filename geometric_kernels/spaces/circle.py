@@ -5,6 +5,8 @@ The Geomstats package is used for most of the geometric calculations.
 """
 import geomstats as gs
 import lab as B
+import numpy as np
+from opt_einsum import contract as einsum
 
 from geometric_kernels.lab_extras import from_numpy
 from geometric_kernels.spaces.base import DiscreteSpectrumSpace
@@ -12,7 +14,7 @@ from geometric_kernels.spaces.eigenfunctions import (
     Eigenfunctions,
     EigenfunctionWithAdditionTheorem,
 )
-from geometric_kernels.utils.utils import Optional, chain
+from geometric_kernels.utils.utils import Optional
 
 
 class SinCosEigenfunctions(EigenfunctionWithAdditionTheorem):
@@ -26,25 +28,37 @@ class SinCosEigenfunctions(EigenfunctionWithAdditionTheorem):
 
         self._num_eigenfunctions = num_levels * 2 - 1
         self._num_levels = num_levels
+        self._num_eigenfunctions_per_level = np.full(num_levels, 2, dtype=np.int64)
+        self._num_eigenfunctions_per_level[0] = 1
+        # floating point copy, used as N_l in the addition theorem
+        self._num_eigenfunctions_per_level_float = (
+            self._num_eigenfunctions_per_level.astype(float)
+        )
+
+        # Per-eigenfunction frequency, phase and normalisation, such that the m-th
+        # eigenfunction is const[m] * cos(freq[m] * theta - phase[m]). Sines are
+        # cosines shifted by pi/2, which lets `__call__` evaluate all columns at once.
+        self._freqs = np.repeat(np.arange(num_levels, dtype=float), 2)[1:]  # [M]
+        self._phases = np.r_[0.0, np.tile([0.0, np.pi / 2], num_levels - 1)]  # [M]
+        self._consts = np.full(self._num_eigenfunctions, 2.0**0.5)  # [M]
+        self._consts[0] = 1.0
 
     def __call__(self, X: B.Numeric, **parameters) -> B.Numeric:
         """
         :param X: polar coordinates on the circle, [N, 1].
         :param parameters: unused.
+        :return: [N, M], in the floating point dtype of `X`. Passing single
+            precision inputs gives a single precision basis, integer inputs
+            are promoted to a floating point dtype.
         """
-        N = B.shape(X)[0]
         theta = X
-        const = 2.0**0.5
-        values = []
-        for level in range(self.num_levels):
-            if level == 0:
-                values.append(B.ones(B.dtype(X), N, 1))
-            else:
-                freq = 1.0 * level
-                values.append(const * B.cos(freq * theta))
-                values.append(const * B.sin(freq * theta))
-
-        return B.concat(*values, axis=1)[:, : self._num_eigenfunctions]  # [N, M]
+        dtype = B.dtype_float(X)
+        theta = B.cast(dtype, theta)
+        freqs = B.cast(dtype, from_numpy(X, self._freqs))  # [M]
+        phases = B.cast(dtype, from_numpy(X, self._phases))  # [M]
+        consts = B.cast(dtype, from_numpy(X, self._consts))  # [M]
+
+        return consts * B.cos(theta * freqs[None, :] - phases[None, :])  # [N, M]
 
     def _addition_theorem(self, X: B.Numeric, X2: B.Numeric, **parameters) -> B.Numeric:
         r"""
@@ -65,16 +79,20 @@ class SinCosEigenfunctions(EigenfunctionWithAdditionTheorem):
             a value for each level [N, N2, L]
         """
         theta1, theta2 = X, X2
-        angle_between = theta1[:, None, :] - theta2[None, :, :]  # [N, N2, 1]
         freqs = B.range(B.dtype(X), self.num_levels)  # [L]
-        values = B.cos(freqs[None, None, :] * angle_between)  # [N, N2, L]
-        values = (
-            B.cast(
-                B.dtype(X),
-                from_numpy(X, self.num_eigenfunctions_per_level)[None, None, :],
-            )
-            * values
-        )
+        num_per_level = B.cast(
+            B.dtype(X), from_numpy(X, self._num_eigenfunctions_per_level_float)
+        )  # [L]
+        angles1 = theta1 * freqs[None, :]  # [N, L]
+        angles2 = theta2 * freqs[None, :]  # [N2, L]
+        # cos(a - b) = cos(a) cos(b) + sin(a) sin(b), so that the trigonometric
+        # functions are only evaluated on [N, L] and [N2, L] arrays. N_l is applied
+        # to the [N, L] factors rather than to the [N, N2, L] result.
+        values = einsum(
+            "nl,ml->nml", num_per_level * B.cos(angles1), B.cos(angles2)
+        ) + einsum(
+            "nl,ml->nml", num_per_level * B.sin(angles1), B.sin(angles2)
+        )  # [N, N2, L]
         return values  # [N, N2, L]
 
     def _addition_theorem_diag(self, X: B.Numeric, **parameters) -> B.Numeric:
@@ -86,12 +104,12 @@ class SinCosEigenfunctions(EigenfunctionWithAdditionTheorem):
         :return: Evaluate the sum of eigenfunctions on each level. Returns
             a value for each level [N, L]
         """
-        N = X.shape[0]
-        ones = B.ones(B.dtype(X), N, self.num_levels)  # [N, L]
-        value = ones * B.cast(
-            B.dtype(X), from_numpy(X, self.num_eigenfunctions_per_level)[None, :]
-        )
-        return value  # [N, L]
+        N = B.shape(X)[0]
+        num_per_level = B.cast(
+            B.dtype(X), from_numpy(X, self._num_eigenfunctions_per_level_float)
+        )  # [L]
+        # materialised (and writable) [N, L] array, without an [N, L] ones buffer
+        return B.ones(B.dtype(X), N, 1) * num_per_level[None, :]  # [N, L]
 
     @property
     def num_eigenfunctions(self) -> int:
@@ -111,7 +129,7 @@ class SinCosEigenfunctions(EigenfunctionWithAdditionTheorem):
     @property
     def num_eigenfunctions_per_level(self) -> B.Numeric:
         """Number of eigenfunctions per level, [N_l]_{l=0}^{L-1}"""
-        return [1 if level == 0 else 2 for level in range(self.num_levels)]
+        return self._num_eigenfunctions_per_level.copy()
 
 
 class Circle(DiscreteSpectrumSpace, gs.geometry.hypersphere.Hypersphere):
@@ -169,7 +187,7 @@ class Circle(DiscreteSpectrumSpace, gs.geometry.hypersphere.Hypersphere):
         """
         eigenfunctions = SinCosEigenfunctions(num)
         eigenvalues_per_level = B.range(num) ** 2  # [num,]
-        eigenvalues = chain(
+        eigenvalues = np.repeat(
             eigenvalues_per_level,
             eigenfunctions.num_eigenfunctions_per_level,
         )  # [M,]
@@ -2,18 +2,27 @@
 Graph object
 """
 
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 import lab as B
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigsh, splu
 
-from geometric_kernels.lab_extras import degree, eigenpairs, set_value
+from geometric_kernels.lab_extras import SHIFT_INVERT_SIGMA, eigenpairs, set_value
 from geometric_kernels.spaces.base import (
     ConvertEigenvectorsToEigenfunctions,
     DiscreteSpectrumSpace,
 )
 from geometric_kernels.spaces.eigenfunctions import Eigenfunctions
 
+# Maximum number of eigensystems (one per requested `num`) kept in `Graph.cache`.
+_MAX_CACHE_SIZE = 8
+
+# Number of rows compared at a time when checking dense numpy adjacencies for symmetry.
+_SYMMETRY_CHECK_BLOCK_SIZE = 1024
+
 
 class Graph(DiscreteSpectrumSpace):
     """
@@ -26,7 +35,11 @@ class Graph(DiscreteSpectrumSpace):
             where adjacency_matrix[i, j] is non-zero if there is an edge
             between nodes i and j. Scipy's sparse matrices are supported.
         """
-        self.cache: Dict[int, Tuple[B.Numeric, B.Numeric]] = {}
+        self.cache: "OrderedDict[int, Tuple[B.Numeric, B.Numeric]]" = OrderedDict()
+        self._shift_invert_op: Optional[LinearOperator] = None
+        if sp.issparse(adjacency_matrix):
+            # CSR makes both the symmetry check and the Laplacian O(|E|)
+            adjacency_matrix = sp.csr_matrix(adjacency_matrix)
         self._checks(adjacency_matrix)
         self.set_laplacian(adjacency_matrix)  # type: ignore
 
@@ -36,36 +49,111 @@ class Graph(DiscreteSpectrumSpace):
             len(B.shape(adjacency)) == 2 and adjacency.shape[0] == adjacency.shape[1]
         ), "Matrix is not square."
 
-        # this is more efficient than (adj == adj.T).all()
-        assert not B.any(adjacency != B.T(adjacency)), "Adjacency is not symmetric."
+        if sp.issparse(adjacency):
+            # only touches the stored entries, no dense [n, n] temporary
+            is_symmetric = (adjacency != adjacency.T).nnz == 0
+        elif isinstance(adjacency, np.ndarray):
+            # compare blocks of rows against the matching blocks of columns, which
+            # bounds the temporaries and stops at the first non-symmetric block
+            n, block = adjacency.shape[0], _SYMMETRY_CHECK_BLOCK_SIZE
+            is_symmetric = all(
+                np.array_equal(adjacency[i : i + block], adjacency[:, i : i + block].T)
+                for i in range(0, n, block)
+            )
+        else:
+            # this is more efficient than (adj == adj.T).all()
+            is_symmetric = not B.any(adjacency != B.T(adjacency))
+        assert is_symmetric, "Adjacency is not symmetric."
 
     @property
     def dimension(self) -> int:
         return 0  # this is needed for the kernel math to work out
 
     def set_laplacian(self, adjacency):
-        self._laplacian = degree(adjacency) - adjacency
+        if isinstance(adjacency, np.ndarray) or sp.issparse(adjacency):
+            # The shift-invert eigensolver needs double precision: in single precision
+            # L - 1e-8 I rounds back to the singular L. Promote once here rather than
+            # letting integer or float32 adjacencies reach ARPACK as they are.
+            adjacency = adjacency.astype(np.float64, copy=False)
+        if sp.issparse(adjacency):
+            self._degree = np.asarray(adjacency.sum(axis=0)).ravel()  # [n,]
+            self._laplacian = (sp.diags(self._degree) - adjacency).tocsr()
+        else:
+            self._degree = B.sum(adjacency, axis=0)  # [n,]
+            self._laplacian = B.diag(self._degree) - adjacency
+        self._shift_invert_op = None
+
+    def _sparse_eigenpairs(self, num: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the `num` smallest eigenpairs of a sparse Laplacian using ARPACK
+        in shift-invert mode. The LU factorisation of the shifted Laplacian is
+        stored, so that subsequent calls with a different `num` reuse it.
+
+        :param num: number of eigenpairs to compute, should be smaller than n.
+        :return: A Tuple of eigenvalues [num,], eigenvectors [n, num]
+        """
+        if self._shift_invert_op is None:
+            n = self._laplacian.shape[0]
+            shifted = (self._laplacian - SHIFT_INVERT_SIGMA * sp.identity(n)).tocsc()
+            lu = splu(shifted)
+            self._shift_invert_op = LinearOperator(
+                shifted.shape, matvec=lu.solve, dtype=shifted.dtype
+            )
+
+        return eigsh(
+            self._laplacian,
+            num,
+            sigma=SHIFT_INVERT_SIGMA,
+            OPinv=self._shift_invert_op,
+        )
 
     def get_eigensystem(self, num):
         """
         Returns the first `num` eigenvalues and eigenvectors of the graph Laplacian.
-        Caches the solution to prevent re-computing the same values. Note that, if a
-        sparse scipy matrix is input, requesting all n eigenpairs will lead to a
-        conversion of the sparse matrix to a dense one due to scipy.sparse.linalg.eigsh
-        limitations.
+        Caches the solution to prevent re-computing the same values, and serves
+        requests for fewer eigenpairs than an already cached solution from that
+        solution. The least recently used entries are evicted once more than
+        `_MAX_CACHE_SIZE` solutions are cached. This bounds the number of entries,
+        not memory: solutions served from a larger one are slices of it (views for
+        numpy), which keep the larger arrays alive after it is evicted. Note that,
+        if a sparse scipy matrix is input, requesting all n eigenpairs will lead to
+        a conversion of the sparse matrix to a dense one due to
+        scipy.sparse.linalg.eigsh limitations. For fewer than n eigenpairs of a
+        sparse scipy matrix, the factorisation used by the shift-invert solver is
+        reused across values of `num`.
 
         :param num: number of eigenvalues and functions to return.
         :return: A Tuple of eigenvectors [n, num], eigenvalues [num, 1]
         """
-        if num not in self.cache:
-            evals, evecs = eigenpairs(self._laplacian, num)
-            evals = set_value(
-                evals, 0, np.finfo(float).eps
-            )  # lowest eigenval should be zero
-
-            self.cache[num] = (evecs, evals[:, None])
-
-        return self.cache[num]
+        if num in self.cache:
+            self.cache.move_to_end(num)
+            return self.cache[num]
+
+        larger = [k for k in self.cache if k > num]
+        if larger:
+            # the first `num` eigenpairs are a prefix of any larger solution
+            source = min(larger)
+            self.cache.move_to_end(source)
+            evecs, evals = self.cache[source]
+            eigensystem = (evecs[:, :num], evals[:num])
+        else:
+            if sp.issparse(self._laplacian) and num < self._laplacian.shape[0]:
+                evals, evecs = self._sparse_eigenpairs(num)
+            else:
+                evals, evecs = eigenpairs(self._laplacian, num)
+            # lowest eigenval should be zero
+            if isinstance(evals, np.ndarray):
+                # the solvers return a fresh array, so it can be updated in place
+                evals[0] = np.finfo(evals.dtype).eps
+            else:
+                evals = set_value(evals, 0, np.finfo(float).eps)
+            eigensystem = (evecs, evals[:, None])
+
+        self.cache[num] = eigensystem
+        if len(self.cache) > _MAX_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        return eigensystem
 
     def get_eigenfunctions(self, num: int) -> Eigenfunctions:
         """
@@ -91,9 +179,21 @@ class Graph(DiscreteSpectrumSpace):
         """
         return self.get_eigensystem(num)[1]
 
+    def get_heat_diagonal(self, t: B.Numeric, num: int) -> B.Numeric:
+        """
+        Diagonal of the heat semigroup exp(-t L) in the basis of the first `num`
+        eigenvectors of the graph Laplacian. Reuses the cached eigensystem, so that
+        evaluating for many values of `t` only costs an elementwise exponential.
+
+        :param t: diffusion time
+        :param num: number of eigenvalues
+        :return: exp(-t * eigenvalues) [num, 1]
+        """
+        return B.exp(-t * self.get_eigenvalues(num))
+
     def get_repeated_eigenvalues(self, num: int) -> B.Numeric:
         """
         :param num: number of eigenvalues
         :return: eigenvalues [num, 1]
         """
-        return self.get_eigenvalues(num)
+        return self.get_eigensystem(num)[1]
@@ -36,7 +36,11 @@ class SphericalHarmonics(EigenfunctionWithAdditionTheorem):
         """
         self.dim = dim
         self._num_levels = num_levels
-        self._num_eigenfunctions = self.degree_to_num_eigenfunctions(self._num_levels)
+        self._num_eigenfunctions_per_level = np.array(
+            [num_harmonics(dim + 1, level) for level in range(num_levels)],
+            dtype=np.int64,
+        )
+        self._num_eigenfunctions = int(np.sum(self._num_eigenfunctions_per_level))
         self._spherical_harmonics = _SphericalHarmonics(
             dimension=dim + 1, degrees=self._num_levels
         )
@@ -134,7 +138,7 @@ class SphericalHarmonics(EigenfunctionWithAdditionTheorem):
     @property
     def num_eigenfunctions_per_level(self) -> B.Numeric:
         """Number of eigenfunctions per level, [N_l]_{l=0}^{L-1}"""
-        return [num_harmonics(self.dim + 1, level) for level in range(self.num_levels)]
+        return self._num_eigenfunctions_per_level.copy()
 
     @classmethod
     def from_levels(cls, dimension, num_levels):
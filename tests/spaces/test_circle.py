@@ -55,6 +55,29 @@ def test_call_eigenfunctions(
     assert output.shape == (Consts.num_data, eigenfunctions.num_eigenfunctions)
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_call_eigenfunctions_values(
+    dtype, eigenfunctions: EigenfunctionWithAdditionTheorem
+):
+    theta = np.arange(-3, 4).reshape(-1, 1).astype(dtype)  # [N, 1]
+    expected = [np.ones_like(theta)]
+    for level in range(1, eigenfunctions.num_levels):
+        expected.append(np.sqrt(2) * np.cos(level * theta))
+        expected.append(np.sqrt(2) * np.sin(level * theta))
+    expected = np.concatenate(expected, axis=1)  # [N, M]
+    np.testing.assert_array_almost_equal(B.to_numpy(eigenfunctions(theta)), expected)
+
+
+def test_eigenfunctions_keep_input_dtype(
+    inputs: Tuple[B.Numeric, B.Numeric],
+    eigenfunctions: EigenfunctionWithAdditionTheorem,
+):
+    inputs, inputs2 = B.cast(np.float32, inputs[0]), B.cast(np.float32, inputs[1])
+    assert B.dtype(eigenfunctions(inputs)) == B.dtype(inputs)
+    assert B.dtype(eigenfunctions._addition_theorem(inputs, inputs2)) == B.dtype(inputs)
+    assert B.dtype(eigenfunctions._addition_theorem_diag(inputs)) == B.dtype(inputs)
+
+
 def test_eigenfunctions_shape(eigenfunctions: EigenfunctionWithAdditionTheorem):
     num_eigenfunctions_manual = np.sum(eigenfunctions.num_eigenfunctions_per_level)
     assert num_eigenfunctions_manual == eigenfunctions.num_eigenfunctions
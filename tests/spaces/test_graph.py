@@ -6,10 +6,12 @@ import numpy as np
 import scipy.sparse as sp
 import tensorflow as tf
 import torch
+from scipy.linalg import expm
 
 from geometric_kernels.jax import *  # noqa
 from geometric_kernels.kernels import MaternKarhunenLoeveKernel
 from geometric_kernels.spaces import Graph
+from geometric_kernels.spaces.graph import _MAX_CACHE_SIZE
 from geometric_kernels.tensorflow import *  # noqa
 from geometric_kernels.torch import *  # noqa
 
@@ -112,6 +114,8 @@ def run_tests_with_adj(A, L, tol=1e-14, tol_m=1e-7):
     ##############################################
     # Fewer than n eigencomps check
 
+    # fresh graph, so that the solver is used rather than the cached full solution
+    graph = Graph(A)
     m = 4
     evecs = graph.get_eigenvectors(m)
     evals = graph.get_eigenvalues(m)
@@ -152,3 +156,61 @@ def test_graphs_tf():
 
 def test_graphs_jax():
     run_tests_with_adj(jax.numpy.array(A), L, 1e-6, 1e-6)
+
+
+def test_eigensystem_cache():
+    graph = Graph(sp.csr_matrix(A))
+
+    graph.get_eigensystem(5)
+    evecs_prefix, evals_prefix = graph.get_eigensystem(3)
+
+    evecs_fresh, evals_fresh = Graph(sp.csr_matrix(A)).get_eigensystem(3)
+    np.testing.assert_allclose(evals_prefix, evals_fresh, atol=1e-7)
+    np.testing.assert_allclose(np.abs(evecs_prefix), np.abs(evecs_fresh), atol=1e-7)
+
+
+def test_shift_invert_factorisation_reused():
+    graph = Graph(sp.csr_matrix(A))
+
+    graph.get_eigensystem(3)
+    shift_invert_op = graph._shift_invert_op
+    evals = graph.get_eigenvalues(5)
+
+    assert graph._shift_invert_op is shift_invert_op
+    np.testing.assert_allclose(evals[:, 0], np.linalg.eigvalsh(L)[:5], atol=1e-7)
+
+
+def test_eigensystem_cache_eviction():
+    n = _MAX_CACHE_SIZE + 4
+    path = np.eye(n, k=1) + np.eye(n, k=-1)  # path graph, distinct eigenvalues
+    graph = Graph(sp.csr_matrix(path))
+
+    nums = range(2, _MAX_CACHE_SIZE + 3)
+    for num in nums:
+        graph.get_eigensystem(num)
+    assert len(graph.cache) == _MAX_CACHE_SIZE
+    assert nums[0] not in graph.cache
+
+    # a prefix hit marks the larger solution it is served from as recently used
+    graph.get_eigensystem(1)
+    assert len(graph.cache) == _MAX_CACHE_SIZE
+    assert nums[1] in graph.cache
+    assert nums[2] not in graph.cache
+
+
+def test_heat_diagonal():
+    graph = Graph(A)
+    n, t = A.shape[0], 0.7
+
+    evecs = graph.get_eigenvectors(n)
+    heat = evecs @ np.diag(graph.get_heat_diagonal(t, n)[:, 0]) @ evecs.T
+    np.testing.assert_allclose(heat, expm(-t * L), atol=1e-12)
+
+
+def test_laplacian_dtype():
+    for dtype in [int, bool, np.float32]:
+        graph = Graph(sp.csr_matrix(A.astype(dtype)))
+        assert graph._laplacian.dtype == np.float64
+
+        evals = graph.get_eigenvalues(4)
+        np.testing.assert_allclose(evals[:, 0], np.linalg.eigvalsh(L)[:4], atol=1e-7)